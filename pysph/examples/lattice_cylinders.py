@@ -30,6 +30,7 @@ nu = a * Umax / Re
 # Numerical setup
 nx = 100
 dx = L / nx
+ny = int(round(H / dx))
 ghost_extent = 5 * 1.5 * dx
 hdx = 1.0
 
@@ -54,30 +55,30 @@ class LatticeCylinders(Application):
 
     def create_particles(self):
         # create all the particles
-        _x = np.arange(dx / 2, L, dx)
-        _y = np.arange(dx / 2, H, dx)
-        x, y = np.meshgrid(_x, _y)
-        x = x.ravel()
-        y = y.ravel()
-
-        # sort out the fluid and the solid
-        indices = []
-        cx = 0.5 * L
-        cy = 0.5 * H
-        for i in range(x.size):
-            xi = x[i]
-            yi = y[i]
-            if (np.sqrt((xi - cx)**2 + (yi - cy)**2) > a):
-                    # if ( (yi > 0) and (yi < H) ):
-                indices.append(i)
+        _x = np.linspace(dx / 2, L - dx / 2, nx)
+        _y = np.linspace(dx / 2, H - dx / 2, ny)
+        x = np.tile(_x, _y.size)
+        y = np.repeat(_y, _x.size)
+
+        # sort out the fluid and the solid: a particle is solid if it lies
+        # in any of the cylinders. The squared distance avoids a sqrt per
+        # particle and testing one cylinder at a time keeps the temporaries
+        # at the size of the particle arrays.
+        centers = np.array([[0.5 * L, 0.5 * H]])
+        solid_mask = np.zeros(x.size, dtype=bool)
+        for cx, cy in centers:
+            r2 = np.square(x - cx)
+            r2 += np.square(y - cy)
+            solid_mask |= r2 <= a * a
+        fluid_mask = ~solid_mask
 
         # create the arrays
-        solid = get_particle_array(name='solid', x=x, y=y)
-
-        # remove the fluid particles from the solid
-        fluid = solid.extract_particles(indices)
-        fluid.set_name('fluid')
-        solid.remove_particles(indices)
+        fluid = get_particle_array(
+            name='fluid', x=x[fluid_mask], y=y[fluid_mask]
+        )
+        solid = get_particle_array(
+            name='solid', x=x[solid_mask], y=y[solid_mask]
+        )
 
         print("Periodic cylinders :: Re = %g, nfluid = %d, nsolid=%d, dt = %g" % (
             Re, fluid.get_number_of_particles(),
@@ -87,22 +88,25 @@ class LatticeCylinders(Application):
 
         # setup the particle properties
         volume = dx * dx
+        m_val = volume * rho0
+        inv_vol = 1. / volume
+        h_val = hdx * dx
 
         # mass is set to get the reference density of rho0
-        fluid.m[:] = volume * rho0
-        solid.m[:] = volume * rho0
-        solid.rho[:] = rho0
+        fluid.m.fill(m_val)
+        solid.m.fill(m_val)
+        solid.rho.fill(rho0)
 
         # reference pressures and densities
-        fluid.rho[:] = rho0
+        fluid.rho.fill(rho0)
 
         # volume is set as dx^2
-        fluid.V[:] = 1. / volume
-        solid.V[:] = 1. / volume
+        fluid.V.fill(inv_vol)
+        solid.V.fill(inv_vol)
 
         # smoothing lengths
-        fluid.h[:] = hdx * dx
-        solid.h[:] = hdx * dx
+        fluid.h.fill(h_val)
+        solid.h.fill(h_val)
 
         # return the particle list
         return [fluid, solid]
@@ -78,24 +78,24 @@ class PoiseuilleFlow(Application):
     def create_particles(self):
         Lx = self.Lx
         Ly = self.Ly
-        _x = np.arange( dx/2, Lx, dx )
+        # use exact particle counts, arange can gain or lose a point to
+        # round-off in the step.
+        nx = int(round(Lx/dx))
+        ny = int(round(Ly/dx))
+        nghost = int(round(ghost_extent/dx))
+        _x = np.linspace( dx/2, Lx - dx/2, nx )
 
         # create the fluid particles
-        _y = np.arange( dx/2, Ly, dx )
+        _y = np.linspace( dx/2, Ly - dx/2, ny )
 
-        x, y = np.meshgrid(_x, _y); fx = x.ravel(); fy = y.ravel()
+        fx = np.tile(_x, _y.size); fy = np.repeat(_y, _x.size)
 
-        # create the channel particles at the top
-        _y = np.arange(Ly+dx/2, Ly+dx/2+ghost_extent, dx)
-        x, y = np.meshgrid(_x, _y); tx = x.ravel(); ty = y.ravel()
-
-        # create the channel particles at the bottom
-        _y = np.arange(-dx/2, -dx/2-ghost_extent, -dx)
-        x, y = np.meshgrid(_x, _y); bx = x.ravel(); by = y.ravel()
-
-        # concatenate the top and bottom arrays
-        cx = np.concatenate( (tx, bx) )
-        cy = np.concatenate( (ty, by) )
+        # create the channel particles at the top and the bottom, only the
+        # rows of y coordinates need to be joined.
+        _yt = np.linspace(Ly+dx/2, Ly+dx/2+(nghost-1)*dx, nghost)
+        _yb = np.linspace(-dx/2, -dx/2-(nghost-1)*dx, nghost)
+        _y = np.concatenate( (_yt, _yb) )
+        cx = np.tile(_x, _y.size); cy = np.repeat(_y, _x.size)
 
         # create the arrays
         channel = get_particle_array(name='channel', x=cx, y=cy)
@@ -110,22 +110,25 @@ class PoiseuilleFlow(Application):
 
         # setup the particle properties
         volume = dx * dx
+        m_val = volume * self.rho0
+        inv_vol = 1./volume
+        h_val = hdx * dx
 
         # mass is set to get the reference density of rho0
-        fluid.m[:] = volume * self.rho0
-        channel.m[:] = volume * self.rho0
+        fluid.m.fill(m_val)
+        channel.m.fill(m_val)
 
         # Set the default rho.
-        fluid.rho[:] = self.rho0
-        channel.rho[:] = self.rho0
+        fluid.rho.fill(self.rho0)
+        channel.rho.fill(self.rho0)
 
         # volume is set as dx^2
-        fluid.V[:] = 1./volume
-        channel.V[:] = 1./volume
+        fluid.V.fill(inv_vol)
+        channel.V.fill(inv_vol)
 
         # smoothing lengths
-        fluid.h[:] = hdx * dx
-        channel.h[:] = hdx * dx
+        fluid.h.fill(h_val)
+        channel.h.fill(h_val)
 
         # return the particle list
         return [fluid, channel]
@@ -1,4 +1,5 @@
 from collections import defaultdict
+import os
 from os.path import dirname, join, expanduser, realpath
 from textwrap import dedent
 
@@ -36,6 +37,16 @@ def get_helper_code(helpers):
     return result
 
 
+def get_extra_compile_args():
+    """Return the extra compiler flags given in the ``PYSPH_CFLAGS``
+    environment variable, for example ``"-march=native -ffast-math"``.
+
+    These are off by default as such flags make the generated extension
+    specific to the build machine or change the floating point results.
+    """
+    return os.environ.get('PYSPH_CFLAGS', '').split()
+
+
 ###############################################################################
 def get_all_array_names(particle_arrays):
     """For each type of carray, find the union of the names of all particle
@@ -166,9 +177,17 @@ class AccelerationEvalCythonHelper(object):
         # Add pysph/base directory to inc_dirs for including spatial_hash.h
         # for SpatialHashNNPS
         extra_inc_dirs = [join(dirname(dirname(realpath(__file__))), 'base')]
+        # The extension is cached on a hash of its source, so record any
+        # extra flags in the source to rebuild it when they change.
+        extra_compile_args = get_extra_compile_args()
+        if extra_compile_args:
+            code += '\n# Extra compile args: %s\n' % (
+                ' '.join(extra_compile_args)
+            )
         self._ext_mod = ExtModule(
             code, verbose=False, root=root, depends=depends,
-            extra_inc_dirs=extra_inc_dirs
+            extra_inc_dirs=extra_inc_dirs,
+            extra_compile_args=extra_compile_args
         )
         self._module = self._ext_mod.load()
         return self._module
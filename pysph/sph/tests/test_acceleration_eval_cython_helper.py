@@ -1,6 +1,12 @@
 # Standard library imports.
+import os
 import unittest
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 # Library imports.
 import numpy as np
 
@@ -11,7 +17,7 @@ from pysph.base.particle_array import ParticleArray
 from compyle.api import KnownType
 from pysph.base.kernels import CubicSpline
 from pysph.sph.acceleration_eval_cython_helper import (
-    get_all_array_names, get_known_types_for_arrays,
+    get_all_array_names, get_extra_compile_args, get_known_types_for_arrays,
     AccelerationEvalCythonHelper
 )
 from pysph.sph.acceleration_eval import AccelerationEval
@@ -58,6 +64,54 @@ class TestGetKnownTypesForAllArrays(unittest.TestCase):
             self.assertEqual(repr(result[key]), repr(expect[key]))
 
 
+class TestGetExtraCompileArgs(unittest.TestCase):
+    def test_no_extra_args_by_default(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('PYSPH_CFLAGS', None)
+            self.assertEqual(get_extra_compile_args(), [])
+
+    def test_extra_args_are_read_from_the_environment(self):
+        env = {'PYSPH_CFLAGS': ' -march=native  -ffast-math '}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(
+                get_extra_compile_args(), ['-march=native', '-ffast-math']
+            )
+
+
+class TestCompileWithExtraArgs(unittest.TestCase):
+    def _compile(self, env):
+        pa = ParticleArray(name='f', m=[1.0], rho=[0.0])
+        eqs = [Group(equations=[SummationDensity(dest='f', sources=['f'])])]
+        aeval = AccelerationEval([pa], eqs, kernel=CubicSpline(dim=1))
+        helper = AccelerationEvalCythonHelper(aeval)
+        patch = mock.patch(
+            'pysph.sph.acceleration_eval_cython_helper.ExtModule'
+        )
+        with mock.patch.dict(os.environ), patch as ext_module:
+            os.environ.pop('PYSPH_CFLAGS', None)
+            os.environ.update(env)
+            helper.compile('pass\n')
+        return ext_module.call_args
+
+    def test_extra_args_are_passed_to_ext_module(self):
+        # When
+        args, kw = self._compile({'PYSPH_CFLAGS': '-march=native'})
+
+        # Then
+        self.assertEqual(kw['extra_compile_args'], ['-march=native'])
+        self.assertIn('# Extra compile args: -march=native', args[0])
+
+    def test_extra_args_change_the_source(self):
+        # When
+        default_args, default_kw = self._compile({})
+        args, kw = self._compile({'PYSPH_CFLAGS': '-march=native'})
+
+        # Then
+        self.assertEqual(default_args[0], 'pass\n')
+        self.assertEqual(default_kw['extra_compile_args'], [])
+        self.assertNotEqual(args[0], default_args[0])
+
+
 class TestAccelerationHelperCython(unittest.TestCase):
     def setUp(self):
         cfg = get_config()